@@ -1,6 +1,7 @@
 import contextlib
 import logging
 import os
+import random
 import threading
 import time
 from abc import ABC, abstractmethod
@@ -47,6 +48,10 @@ DEVICE_MXID = "unknown"
 # this needs to be in sync with globals.py from robothub_core wrapper
 LOCAL_DEV = APP_INSTANCE_ID == "ROBOTHUB_ROBOT_APP_ID" and APP_VERSION == "ROBOTHUB_APP_VERSION"
 
+# Device details that are only cached once read successfully. The bootloader version is left out, it is legitimately
+# missing on some devices.
+_CACHED_DEVICE_DETAILS = ("mxid", "protocol", "platform", "product_name", "board_name", "board_rev")
+
 
 class BaseApplication(robothub_core.RobotHubApplication, ABC):
 
@@ -61,6 +66,7 @@ class BaseApplication(robothub_core.RobotHubApplication, ABC):
         self._device_ip: Optional[str] = None
         self._device_product_name: Optional[str] = None
         self.__device_state: Optional[robothub_core.DeviceState] = None
+        self.__device_info: Optional[dict] = None
         self.__device_thread: Optional[Thread] = None
         self._device_stop_event = threading.Event()
         self._device: Optional[Union[OakCamera, depthai.Device]] = None
@@ -145,7 +151,18 @@ class BaseApplication(robothub_core.RobotHubApplication, ABC):
 
     def __report_device_info(self) -> None:
         try:
-            device_info = get_device_details(self._get_dai_device(), self.__device_state)
+            dai_device = self._get_dai_device()
+            if dai_device is None:
+                device_info = get_device_details(dai_device, self.__device_state)
+            else:
+                # Everything apart from the state is fixed for the lifetime of a connection, read it from the device only once
+                if self.__device_info is None:
+                    device_info = get_device_details(dai_device, self.__device_state)
+                    # Failed reads (common right after the device boots) are reported as 'unknown', keep retrying them
+                    if all(device_info[key] != "unknown" for key in _CACHED_DEVICE_DETAILS):
+                        self.__device_info = dict(device_info)
+                else:
+                    device_info = dict(self.__device_info, state=self.__device_state.value)
             robothub_core.AGENT.publish_device_info(device_info)
         except Exception as e:
             logger.error(f"Device {self._device_product_name}: could not report info with error: {e}.")
@@ -167,17 +184,20 @@ class BaseApplication(robothub_core.RobotHubApplication, ABC):
         self.__report_device_info()
         product_name = self._device_product_name
         logger.info(f"Establishing connection with Device {product_name}...")
+        retry_delay = 0.5
         while self.running and time.monotonic() < give_up_time:
             logger.debug(
-                f"Device {product_name}: remaining time to connect - {give_up_time - time.monotonic()} seconds."
+                "Device %s: remaining time to connect - %s seconds.", product_name, give_up_time - time.monotonic()
             )
             try:
                 self._device = self._acquire_device()
                                     
             except Exception as e:
-                # If device can't be connected to on first try, wait 5 seconds and try again.
+                # If device can't be connected to, wait and try again. The delay doubles after each failed attempt, up to 5 seconds,
+                # with a bit of jitter so apps sharing a robot don't retry in lockstep.
                 logger.error(f"Device {product_name}: error while trying to connect - {e}.")
-                self.wait(5)
+                self.wait(retry_delay + random.uniform(0, retry_delay / 4))
+                retry_delay = min(retry_delay * 2, 5)
             else:
                 self.__device_state = robothub_core.DeviceState.CONNECTED
                 self.__report_device_info()
@@ -197,6 +217,7 @@ class BaseApplication(robothub_core.RobotHubApplication, ABC):
             self._device.__exit__(1, 2, 3)
             logger.info(f"Device {self._device_product_name}: closed gracefully.")
         self._device = None
+        self.__device_info = None
 
     def get_device(self) -> Optional[Union[OakCamera, depthai.Device]]:
         """
@@ -360,10 +381,13 @@ class BaseSDKApplication(BaseApplication):
         """
         Poll the device for new data. This method is called in a separate thread.
         """
+        # The device is only replaced after this thread is joined, so it is safe to bind it once for the whole loop
+        device = self._device
+        device_stop_event = self._device_stop_event
         try:
-            while self.running and not self._device_stop_event.is_set():
-                self._device.poll()
-                if not self._device.running():
+            while self.running and not device_stop_event.is_set():
+                device.poll()
+                if not device.running():
                     break
                 time.sleep(0.0025)
         finally:
@@ -1,6 +1,9 @@
 import logging
+import os
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from io import BytesIO
 from pathlib import Path
 from typing import List, Optional, Union
@@ -36,6 +39,31 @@ def _catch_event_exception(func):
     return wrapper
 
 
+def _to_bytes(data: Union[np.ndarray, bytes, bytearray]) -> Union[bytes, bytearray]:
+    """
+    Converts encoded image data to a type accepted by events. Bytes and bytearrays are returned as they are,
+    numpy arrays (e.g. cv2.imencode output) are converted with tobytes().
+    """
+    if isinstance(data, (bytes, bytearray)):
+        return data
+    return data.tobytes()
+
+
+def _encode_jpeg(image: np.ndarray, encode_param: list) -> np.ndarray:
+    _, encoded = cv2.imencode('.jpg', image, encode_param)
+    return encoded
+
+
+def _encode_jpegs(images: list, encode_param: list) -> list:
+    """
+    Encodes images as JPEGs. cv2.imencode releases the GIL, so multiple images are encoded in parallel.
+    """
+    if len(images) <= 1:
+        return [_encode_jpeg(image, encode_param) for image in images]
+    with ThreadPoolExecutor(max_workers=min(len(images), os.cpu_count() or 1)) as executor:
+        return list(executor.map(partial(_encode_jpeg, encode_param=encode_param), images))
+
+
 def _log_event_status(result: bool, event_id):
     if result:
         logger.info(f"Event {event_id}: sent successfully.")
@@ -68,7 +96,7 @@ def send_image_event(image: Union[np.ndarray, bytes],
         _, image = cv2.imencode(".jpg", image, [int(cv2.IMWRITE_JPEG_QUALITY), mjpeg_quality])
 
     event = robothub_core.EVENTS.prepare()
-    event.add_frame(bytes(image), device_id)
+    event.add_frame(_to_bytes(image), device_id)
     event.set_title(title)
     if metadata:
         event.set_metadata(metadata)
@@ -107,22 +135,21 @@ def send_frame_event_with_zipped_images(cv_frame: np.ndarray,
         _, cv_frame = cv2.imencode('.jpg', cv_frame, encode_param)
 
     event = robothub_core.EVENTS.prepare()
-    event.add_frame(bytes(cv_frame), device_id)
+    event.add_frame(_to_bytes(cv_frame), device_id)
     event.set_title(title)
     if tags:
         event.set_tags(tags)
     if metadata:
         event.set_metadata(metadata)
-    logger.debug(f'Total files: {len(files)}')
+    logger.debug('Total files: %d', len(files))
+    if encode:
+        files = _encode_jpegs(files, encode_param)
     with BytesIO() as zip_buffer:
-        with zipfile.ZipFile(zip_buffer, 'w') as zip_file:
-            for idx, file in enumerate(files):
-                if encode:
-                    _, encoded = cv2.imencode('.jpg', file, encode_param)
-                else:
-                    encoded = file
+        # JPEGs are already compressed, deflating them again costs CPU for next to no size reduction
+        with zipfile.ZipFile(zip_buffer, 'w', compression=zipfile.ZIP_STORED) as zip_file:
+            for idx, encoded in enumerate(files):
                 # Convert the numpy array to bytes
-                image_bytes = encoded.tobytes()
+                image_bytes = _to_bytes(encoded)
                 # Add the bytes to the zip file with a unique filename
                 filename = f'image_{idx}.jpeg'
                 zip_file.writestr(filename, image_bytes)
@@ -2,7 +2,6 @@ import datetime
 import itertools
 import logging
 import threading
-import time
 import uuid
 from collections import deque
 from enum import Enum
@@ -15,6 +14,11 @@ from depthai_sdk.recorders.video_writers import AvWriter
 from depthai_sdk import FramePacket
 from robothub.events import send_video_event
 
+try:
+    import robothub_core
+except ImportError:
+    import robothub.robothub_core_wrapper as robothub_core
+
 try:
     import av
 except ImportError:
@@ -177,9 +181,13 @@ class FrameBuffer:
                 if timestamp - latest_t_before > datetime.timedelta(seconds=after_seconds):
                     break
             except Empty:
-                time.sleep(0.5)
+                if robothub_core.wait(0.5):
+                    # App is stopping, no more frames will arrive
+                    self.__temporary_queues.discard(temp_queue)
+                    return None
                 retries += 1
                 if retries > 10:
+                    self.__temporary_queues.discard(temp_queue)
                     logger.warning(f"Video capture timed out after 10 retries. "
                                    f"Make sure to use 'frame_buffer.add_frame()' on every_frame")
                     return None
@@ -231,7 +239,8 @@ class FrameBuffer:
             self.__packet_type = PacketType.DEPTHAI if isinstance(packet, dai.ImgFrame) else PacketType.SDK
 
         self.__buffer.append(packet)
-        for q in self.__temporary_queues:
+        # Video saving threads add and remove their queues concurrently, iterate over a snapshot
+        for q in tuple(self.__temporary_queues):
             q.put(packet)
 
     @property
@@ -58,6 +58,10 @@ class LiveView(ABC):
 
         self.codec_r = av.CodecContext.create("h264", "r") if LOCAL_DEV else None
 
+    @property
+    def name(self) -> str:
+        return self._name
+
     @property
     @abstractmethod
     def frame_width(self) -> int:
@@ -231,10 +235,11 @@ class LiveView(ABC):
         :return: Live View with the given unique key.
         :raises ValueError: If a Live View with the given unique key does not exist.
         """
-        if unique_key not in LIVE_VIEWS:
+        live_view = LIVE_VIEWS.get(unique_key)
+        if live_view is None:
             raise ValueError(f'Live View with unique_key {unique_key} does not exist.')
 
-        return LIVE_VIEWS[unique_key]
+        return live_view
 
     def _to_absolute_coords(self, xmin, ymin, xmax, ymax) -> Tuple[int, int, int, int]:
         if isinstance(xmin, float):
@@ -472,6 +477,36 @@ class SdkLiveView(LiveView):
         self.frame_buffer.add_frame(h264_packet)
 
 
+# Overlay config is the same for every frame, it is shared by all published metadata and must not be mutated
+_METADATA_CONFIG = {
+    "output": {
+        "img_scale": 1.0,
+        "show_fps": False,
+        "clickable": True
+    },
+    "detection": {
+        "thickness": 1,
+        "fill_transparency": 0.05,
+        "box_roundness": 0,
+        "color": [0, 255, 0],
+        "bbox_style": 0,
+        "line_width": 0.5,
+        "line_height": 0.5,
+        "hide_label": False,
+        "label_position": 0,
+        "label_padding": 10
+    },
+    'text': {
+        'font_color': [255, 255, 0],
+        'font_transparency': 0.5,
+        'font_scale': 1.0,
+        'font_thickness': 2,
+        'bg_transparency': 0.5,
+        'bg_color': [0, 0, 0]
+    }
+}
+
+
 def _publish_data(stream_handle: robothub_core.StreamHandle,
                   h264_frame,
                   rectangles: List[BoundingBox],
@@ -493,59 +528,27 @@ def _publish_data(stream_handle: robothub_core.StreamHandle,
     :param frame_width: Width of the frame.
     :param frame_height: Height of the frame.
     """
-    timestamp = int(time.perf_counter_ns() / 1e6)
+    timestamp = time.perf_counter_ns() // 1_000_000
+    # Bounding boxes
+    detections = [
+        {'bbox': list(roi), 'label': label, 'color': [0, 255, 255]}
+        for roi, label in zip(rectangles, rectangle_labels)
+    ]
     metadata = {
         "platform": "robothub",
         "frame_shape": [frame_height, frame_width],
-        "config": {
-            "output": {
-                "img_scale": 1.0,
-                "show_fps": False,
-                "clickable": True
-            },
-            "detection": {
-                "thickness": 1,
-                "fill_transparency": 0.05,
-                "box_roundness": 0,
-                "color": [0, 255, 0],
-                "bbox_style": 0,
-                "line_width": 0.5,
-                "line_height": 0.5,
-                "hide_label": False,
-                "label_position": 0,
-                "label_padding": 10
-            },
-            'text': {
-                'font_color': [255, 255, 0],
-                'font_transparency': 0.5,
-                'font_scale': 1.0,
-                'font_thickness': 2,
-                'bg_transparency': 0.5,
-                'bg_color': [0, 0, 0]
-            }
-        },
+        "config": _METADATA_CONFIG,
         "objects": [
             {
                 "type": "detections",
-                "detections": []
-            }
+                "detections": detections
+            },
+            # Texts
+            *(text.prepare().serialize() for text in texts),
+            # Lines
+            *(line.prepare().serialize() for line in lines)
         ]
     }
 
-    # Bounding boxes
-    for roi, label in zip(rectangles, rectangle_labels):
-        xmin, ymin, xmax, ymax = roi
-        metadata['objects'][0]['detections'].append(
-            {'bbox': [xmin, ymin, xmax, ymax], 'label': label, 'color': [0, 255, 255]}
-        )
-
-    # Texts
-    for text in texts:
-        metadata["objects"].append(text.prepare().serialize())
-
-    # Lines
-    for line in lines:
-        metadata["objects"].append(line.prepare().serialize())
-
     # Publish
     stream_handle.publish_video_data(bytes(h264_frame), timestamp, metadata)
@@ -297,8 +297,9 @@ class ColorReplayCamera(ReplayCamera):
                     f"Proccessing time ({process_time:.3f}ms) didn't hit the set camera FPS deadline ({1. / self._fps:.3f}ms)"
                 )
             time_to_sleep = max((1.0 / self._fps) - process_time, 0)
-            logging.debug(f"process_time: {process_time}, time_to_sleep: {time_to_sleep}")
-            time.sleep(time_to_sleep)
+            logging.debug("process_time: %s, time_to_sleep: %s", process_time, time_to_sleep)
+            # Wait on the stop event rather than sleeping, so stop_polling() doesn't have to wait out the frame interval
+            self._stop_event.wait(time_to_sleep)
 
         self._capture_manager.close()
 
@@ -711,8 +712,9 @@ class MonoReplayCamera(ReplayCamera):
                     f"Proccessing time ({process_time:.3f}ms) didn't hit the set camera FPS deadline ({1. / self._fps:.3f}ms)"
                 )
             time_to_sleep = max((1.0 / self._fps) - process_time, 0)
-            logging.debug(f"process_time: {process_time}, time_to_sleep: {time_to_sleep}")
-            time.sleep(time_to_sleep)
+            logging.debug("process_time: %s, time_to_sleep: %s", process_time, time_to_sleep)
+            # Wait on the stop event rather than sleeping, so stop_polling() doesn't have to wait out the frame interval
+            self._stop_event.wait(time_to_sleep)
 
         self._capture_manager.close()
 
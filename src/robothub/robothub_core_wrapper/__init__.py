@@ -5,6 +5,7 @@ Accessible only when running as a Perception App.
 """
 import logging as log
 
+# Configured before the submodules are imported, globals._load_configuration() already logs at import time
 log.basicConfig(format='%(levelname)s | %(funcName)s:%(lineno)s => %(message)s', level=log.INFO)
 
 log.info(f"Local development. Mocking connection with RobotHub cloud.")
@@ -58,20 +58,16 @@ def _check_args(name, mx_id, filename) -> None:
 
     ### Metadata checking functions ###
 
+_META_OBJECT_TYPES = ('detections', 'text', 'trail')
+
 def _check_object_array(object_array: list):
     assert isinstance(object_array, list), "metadata must contain a list of objects for a frame"
     for meta_object in object_array:
         assert isinstance(meta_object, dict), "Each Trail/Text/Detection object must be a dictionary"
-        assert 'type' in meta_object.keys(), "Each Trail/Text/Detection object must specify a type"
-        if meta_object['type'] == 'detections':
-            pass
-        elif meta_object['type'] == 'text':
-            pass
-        elif meta_object['type'] == 'trail':
-            pass
-        else:
+        assert 'type' in meta_object, "Each Trail/Text/Detection object must specify a type"
+        if meta_object['type'] not in _META_OBJECT_TYPES:
             raise RuntimeError('Invalid object type, valid options are: ["trail", "text", "detections"]')
-        if 'children' in meta_object.keys():
+        if 'children' in meta_object:
             _check_object_array(meta_object['children'])
 
 def _check_metadata_config(config: dict):
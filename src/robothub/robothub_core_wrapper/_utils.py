@@ -1,5 +1,19 @@
+import json
 import threading
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_SUBCLASS
+
+
+def _orjson_reject(obj):
+    # Types orjson doesn't serialize natively are left for json to accept or reject
+    raise TypeError
+
 
 def count_threads(include_main: bool = True, include_daemon: bool = True):
     count = 0
@@ -9,3 +23,27 @@ def count_threads(include_main: bool = True, include_daemon: bool = True):
     if not include_main:
         count -= 1
     return count
+
+
+def json_dumps(obj) -> bytes:
+    """
+    Serializes C{obj} to UTF-8 encoded JSON, uses orjson if it is installed.
+
+    Anything orjson would handle differently from json (non-str keys, big integers, datetimes, dataclasses, subclasses
+    of builtin types, ...) is serialized by json instead, so the result and errors match json.dumps. The exceptions are
+    UUID and plain Enum values, which orjson always serializes itself while json rejects them, and NaN/Infinity, which
+    orjson writes as null.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_orjson_reject, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass
+    return json.dumps(obj).encode('utf-8')
+
+
+def json_loads(data: bytes | str):
+    """De-serializes UTF-8 encoded JSON, uses orjson if it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -2,13 +2,13 @@
 Mediates communication between App and Agent. Contains mainly internal methods.
 """
 
-import json
 import os
 import uuid
 from base64 import b64decode, b64encode
 from queue import Queue
 from typing import Dict
 
+from robothub.robothub_core_wrapper._utils import json_dumps, json_loads
 from robothub.robothub_core_wrapper.app import threading
 from robothub.robothub_core_wrapper.events import FutureEvent
 
@@ -121,7 +121,8 @@ class AgentClient:
         self._send_msg(message)
 
     def _send_msg(self, message: dict) -> None:
-        log.debug(f"Message ignored in local environment: {str(message)}")
+        # Lazy formatting, the whole message would otherwise be stringified even when debug logging is disabled
+        log.debug("Message ignored in local environment: %s", message)
 
     def _send_wish(self, *args, **kwargs) -> None:
         log.debug(f"send_wish not available in local environment")
@@ -149,7 +150,7 @@ class AgentClient:
     def _encode_msg(self, dict_object: dict) -> bytes:
         """Serialize dictionary as a JSON string, encode it with utf-8, then encode it with b64"""
         try:
-            enc_msg = b64encode(json.dumps(dict_object).encode('utf-8'))
+            enc_msg = b64encode(json_dumps(dict_object))
             return enc_msg
         except Exception:
             raise RuntimeError(f'message could not be serialized')
@@ -157,7 +158,7 @@ class AgentClient:
     def _decode_msg(self, message: str) -> dict:
         """Decode message with b64, then decode it with utf-8, then de-serialize it from JSON to dict"""
         try:
-            dec_msg = json.loads(b64decode(message).decode('utf-8'))
+            dec_msg = json_loads(b64decode(message))
             return dec_msg
         except Exception:
             raise RuntimeError(f'message could not be decoded')
@@ -60,7 +60,7 @@ class Communicator(ABC):
             'msg_payload': payload,
             'msg_content': 'json' if type(payload) == dict else 'Any',
         }
-        log.debug(f'Sending FE Notification {str(notification)}')
+        log.debug('Sending FE Notification %s', notification)
         self._agent._send_msg(notification)
 
     def request(self, key: str, payload: str | list | dict | None, target: str | None = None, timeoutSeconds: float | int = 30) -> CommunicatorResponse | bool:
@@ -88,7 +88,7 @@ class Communicator(ABC):
         }
         self._sync_requests.add(request_id)
         self._agent._send_msg(request)
-        log.debug(f'Sending FE Sync Request {str(request)}')
+        log.debug('Sending FE Sync Request %s', request)
         return True
 
     def requestAsync(self, key: str, payload: Any, target: str | None = None, timeoutSeconds = 30, on_response: Callable[[Any], None] | None = None) -> None:
@@ -119,7 +119,7 @@ class Communicator(ABC):
         }
         self._async_requests[request_id] = (time.time() + timeoutSeconds, on_response)
         self._agent._send_msg(request)
-        log.debug(f'Sending FE Async Request {str(request)}')
+        log.debug('Sending FE Async Request %s', request)
 
     def on_frontend(self, session_start: Callable | None = None, session_end: Callable | None = None, notification: Callable | None = None, request: Callable | None = None) -> None:
         # TODO add type definition of parameters
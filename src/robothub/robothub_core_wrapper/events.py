@@ -16,7 +16,7 @@ class Events:
     """Used to prepare Events for agent to consume and inform agent via AgentClient"""
 
     def __init__(self):
-        self._folder = Path("/storage/detections")
+        self._folder_str = "/storage/detections/"
 
     def _bind_agent_(self, agent):
         self._agent_client = agent
@@ -29,7 +29,7 @@ class Events:
         """
 
         event_id = str(uuid4())
-        folder = Path(self._folder, event_id)
+        folder = Path(self._folder_str + event_id)
         return FutureEvent(event_id, folder)
 
     def upload(self, event: 'FutureEvent'):
@@ -136,7 +136,7 @@ class FutureEvent:
         self.folder_path = folder_path
         self._sent = False
 
-        self.title = 'Event: ' + _id
+        self.title = f'Event: {_id}'
         """Title of the Event in the Cloud. Set to \"Event\" + UUID by default."""
         self.__videos = []
         """List containing all videos in this Event."""
@@ -177,14 +177,14 @@ class FutureEvent:
         # autogenerate names if necessary
         name, filename = _check_names(name, filename, 'video')
 
-        path = Path(self.folder_path, filename)
+        path = f'{self.folder_path}/{filename}'
         self._write_bytes_to_file(_bytes, path)
-        event_object = {"path": str(path), "name": name, "camera_serial": camera_serial}
+        event_object = {"path": path, "name": name, "camera_serial": camera_serial}
 
         if metadata is not None:
             _check_video_metadata(metadata)
             metadata_filename = filename + '.rh_metadata'
-            metadata_path = Path(self.folder_path, metadata_filename)
+            metadata_path = f'{self.folder_path}/{metadata_filename}'
             self._write_metadata_to_file(metadata, metadata_path)
             event_object['metadata'] = True
         else:
@@ -216,14 +216,14 @@ class FutureEvent:
         # autogenerate names if necessary
         name, filename = _check_names(name, filename, 'frame')
 
-        path = Path(self.folder_path, filename)
+        path = f'{self.folder_path}/{filename}'
         self._write_bytes_to_file(_bytes, path)
-        event_object = {"path": str(path), "name": name, "camera_serial": camera_serial}
+        event_object = {"path": path, "name": name, "camera_serial": camera_serial}
 
         if metadata is not None:
             _check_frame_metadata(metadata)
             metadata_filename = filename + '.rh_metadata'
-            metadata_path = Path(self.folder_path, metadata_filename)
+            metadata_path = f'{self.folder_path}/{metadata_filename}'
             self._write_metadata_to_file(metadata, metadata_path)
             event_object['metadata'] = True
         else:
@@ -249,9 +249,9 @@ class FutureEvent:
         # autogenerate names if necessary
         name, filename = _check_names(name, filename, 'file')
 
-        path = Path(self.folder_path, filename)
+        path = f'{self.folder_path}/{filename}'
         self._write_bytes_to_file(_bytes, path)
-        event_object = {"path": str(path), "name": name}
+        event_object = {"path": path, "name": name}
         self.__files.append(event_object)
 
     def add_existing_file(
@@ -347,11 +347,8 @@ class FutureEvent:
         extra_length = len(tags)
         if current_length + extra_length >= 10:
             raise RuntimeError('An Event cannot have more than 10 tags.')
-        for tag in tags:
-            if isinstance(tag, str):
-                pass
-            else:
-                raise TypeError('All added tags must be strings.')
+        if not all(isinstance(tag, str) for tag in tags):
+            raise TypeError('All added tags must be strings.')
         self.__tags.extend(tags)
 
     def set_tags(self, tags: List[str]):
@@ -365,11 +362,8 @@ class FutureEvent:
         """
         if len(tags) >= 10:
             raise RuntimeError('An Event cannot have more than 10 tags.')
-        for tag in tags:
-            if isinstance(tag, str):
-                pass
-            else:
-                raise TypeError('All tags must be strings.')
+        if not all(isinstance(tag, str) for tag in tags):
+            raise TypeError('All tags must be strings.')
         self.__tags = tags
 
     @property
@@ -462,10 +456,10 @@ class FutureEvent:
             'keep_when_space_low': self.keep_when_space_low
         }
 
-    def _write_metadata_to_file(self, metadata: dict, path: Path) -> None:
+    def _write_metadata_to_file(self, metadata: dict, path: str) -> None:
         log.info(f"Writing metadata to file is not available in local environment.")
 
-    def _write_bytes_to_file(self, _bytes: bytes, path: Path) -> None:
+    def _write_bytes_to_file(self, _bytes: bytes, path: str) -> None:
         log.info(f"Writing to file is not available in local environment.")
         return
 
@@ -3,6 +3,8 @@
 import json
 import logging as log
 import os
+from collections import UserList
+
 import toml
 
 import depthai as dai
@@ -82,13 +84,35 @@ def _load_configuration():
 
 _load_configuration()
 
-DEVICES = []
-available_devices = dai.Device.getAllAvailableDevices()
-for device_info in available_devices:
-    device_info: dai.DeviceInfo
-    device_info_as_dict = {"ipAddress": device_info.name,
-                           "name": device_info.mxid,
-                           "productName": None,
-                           "serialNumber": device_info.mxid
-                           }
-    DEVICES.append(RobotHubDevice('oak', device_info_as_dict))
+def _discover_devices() -> list:
+    """Returns a RobotHubDevice for each DepthAI device available to the host."""
+    devices = []
+    for device_info in dai.Device.getAllAvailableDevices():
+        device_info: dai.DeviceInfo
+        device_info_as_dict = {"ipAddress": device_info.name,
+                               "name": device_info.mxid,
+                               "productName": None,
+                               "serialNumber": device_info.mxid
+                               }
+        devices.append(RobotHubDevice('oak', device_info_as_dict))
+    return devices
+
+
+class _LazyDeviceList(UserList):
+    """List of L{RobotHubDevice}s available to the host. Device discovery is slow, so it only runs on first access."""
+
+    def __init__(self, initlist=None):
+        self._devices = None if initlist is None else list(initlist)
+
+    @property
+    def data(self) -> list:
+        if self._devices is None:
+            self._devices = _discover_devices()
+        return self._devices
+
+    @data.setter
+    def data(self, value: list) -> None:
+        self._devices = value
+
+
+DEVICES = _LazyDeviceList()
@@ -1,13 +1,14 @@
 """Contains classes and methods for streaming to App's Frontend server and the Cloud."""
-import json
 import logging as log
 import os
 import time
 from base64 import b64encode
-from queue import Queue
+from queue import Empty, Queue
 from threading import Event, Thread
 from typing import Dict
 
+from robothub.robothub_core_wrapper._utils import json_dumps
+
 __all__ = ['Streams', 'StreamHandle', 'STREAMS']
 
 
@@ -130,25 +131,27 @@ class StreamHandle:
 
     def _write_loop(self):
         while not self._stop_event.is_set():
-            if not self._write_queue.empty():
-                stream_packet = self._write_queue.get()
-                if len(stream_packet) > 2097152:
-                    log.warning(f"Packet of size {len(stream_packet)} of stream with unique key \"{self.unique_key}\" was not sent! Maximum size of packets is limited to 2 MB.")
-                else:
-                    pass
-            self._stop_event.wait(timeout=0.001)
+            # Block until a packet is queued instead of waking up every millisecond, the timeout only bounds how long stopping takes
+            try:
+                stream_packet = self._write_queue.get(timeout=0.1)
+            except Empty:
+                continue
+            if len(stream_packet) > 2097152:
+                log.warning(f"Packet of size {len(stream_packet)} of stream with unique key \"{self.unique_key}\" was not sent! Maximum size of packets is limited to 2 MB.")
+            else:
+                pass
 
     def _write_stream_packet(self, payload: bytearray | bytes, sizeof_payload: int, timestamp: int, metadata: dict = None):
         header = {'content_bytes': sizeof_payload, 'time': timestamp}
         if metadata:
             assert isinstance(metadata, dict), "metadata must be either a JSON-serializable dictionary or None"
-            metadata = b64encode(json.dumps(metadata).encode('utf-8')).decode('utf-8')
+            metadata = b64encode(json_dumps(metadata)).decode('utf-8')
             header['metadata'] = metadata
         else:
             header['metadata'] = ''
-        header_encoded = (json.dumps(header) + '\n\n').encode('utf-8')
+        header_encoded = json_dumps(header) + b'\n\n'
         # Send header and payload
-        self._write_queue.put(bytes(header_encoded) + bytes(payload), block=True)
+        self._write_queue.put(header_encoded + payload, block=True)
 
     def publish_video_data(self, video_data: bytes | bytearray, timestamp: int, metadata: dict | None = None):
         """